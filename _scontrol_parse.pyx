@@ -0,0 +1,45 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+sktop/_scontrol_parse.pyx
+
+C version of sktop's scontrol key=value parser. Build it in place with
+`python setup.py build_ext --inplace`; sktop falls back to a regex when
+it isn't built.
+"""
+
+from cpython.bytes cimport PyBytes_AS_STRING, PyBytes_GET_SIZE
+from cpython.unicode cimport PyUnicode_DecodeUTF8
+
+
+cdef inline bint _is_space(char c) noexcept nogil:
+    # Same set as \s in a bytes regex: space, \t, \n, \v, \f, \r
+    return c == 32 or 9 <= c <= 13
+
+
+def parse_kv(bytes data):
+    """Parses whitespace-separated key=value tokens into a dict of str.
+
+    Keys run up to the first "=" of a token and must not be empty; tokens
+    without "=" are skipped.
+    """
+    cdef char *p = PyBytes_AS_STRING(data)
+    cdef char *end = p + PyBytes_GET_SIZE(data)
+    cdef char *key
+    cdef char *eq
+    cdef dict details = {}
+
+    while p < end:
+        while p < end and _is_space(p[0]):
+            p += 1
+
+        key = p
+        eq = NULL
+        while p < end and not _is_space(p[0]):
+            if eq == NULL and p[0] == 61:  # "="
+                eq = p
+            p += 1
+
+        if eq != NULL and eq > key:
+            details[PyUnicode_DecodeUTF8(key, eq - key, NULL)] = PyUnicode_DecodeUTF8(eq + 1, p - eq - 1, NULL)
+
+    return details
@@ -0,0 +1,14 @@
+"""
+Builds the optional C extension used by sktop.py:
+
+    pip install cython
+    python setup.py build_ext --inplace
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="sktop",
+    ext_modules=cythonize("_scontrol_parse.pyx"),
+)
@@ -8,72 +8,323 @@ To run as 'sltop', create a symlink or alias.
 
 import argparse
 import asyncio
-import json
 import logging
 import os
+import pwd
+import re
 import shutil
-import subprocess
 import sys
+import threading
 import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from contextlib import aclosing
 from datetime import datetime
-from typing import List, Dict, Optional, Any
+from typing import AsyncIterator, List, Dict, Optional, Tuple, Any
 
+from rich.text import Text
 from textual import work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
-from textual.containers import Container, Vertical, Horizontal, VerticalScroll
+from textual.containers import Container, Vertical, Horizontal
 from textual.screen import ModalScreen
-from textual.widgets import DataTable, Footer, Header, Label, Static, Button, Log, LoadingIndicator
+from textual.timer import Timer
+from textual.widgets import DataTable, Footer, Header, Label, Button, Log, LoadingIndicator, OptionList
+from textual.widgets.data_table import RowKey
+from textual.worker import get_current_worker
+
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:
+    INotify = None
+
+try:
+    import pyslurm
+except ImportError:
+    pyslurm = None
+
+# A whitespace-delimited key=value token from scontrol output. Keys run up to
+# the first "=" and may contain "/" or ":" (e.g. Socks/Node=*).
+_KV_RE = re.compile(rb"(?<!\S)([^\s=]+)=(\S*)")
+
+try:
+    # Optional C build of the same parser, see setup.py
+    from _scontrol_parse import parse_kv as _parse_kv
+except ImportError:
+    def _parse_kv(data: bytes) -> Dict[str, str]:
+        return {k.decode(): v.decode() for k, v in _KV_RE.findall(data)}
 
 # Configure logging
 logging.basicConfig(level=logging.ERROR, filename="sktop.log")
 logger = logging.getLogger("sktop")
 
 
+# Shell loop that prints a fresh squeue listing for every line read from stdin,
+# saving a fork+exec of the shell and Slurm client setup per refresh. squeue's
+# stdout streams straight through (via fd 3) while its stderr is captured and
+# replayed as "---ERR--- " lines; each listing is terminated by a sentinel line
+# carrying squeue's exit status.
+_SQUEUE_SENTINEL = b"---END--- "
+_SQUEUE_ERROR = b"---ERR--- "
+_SQUEUE_LOOP = (
+    'while read _; do '
+    '{ err=$(squeue -u "$1" -t "$2" --noheader -o "$3" 2>&1 >&3); s=$?; } 3>&1; '
+    '[ -z "$err" ] || printf "%s\\n" "$err" | sed "s/^/---ERR--- /"; '
+    'echo "---END--- $s"; '
+    'done'
+)
+
+# Only the columns we display, "|"-separated:
+# JOBID|PARTITION|NAME|STATE|TIME|NODELIST(REASON)
+_SQUEUE_FORMAT = "%i|%P|%j|%T|%M|%R"
+
+# Job states shown in the table; anything else is finished and filtered out
+# by slurmctld (or by us, for pyslurm)
+_ACTIVE_STATES = ("PENDING", "RUNNING", "SUSPENDED", "CONFIGURING", "COMPLETING")
+
+
+async def _read_fd(fd: int) -> bytes:
+    """Reads a pipe to EOF through the event loop, then closes it."""
+    loop = asyncio.get_running_loop()
+    readable = asyncio.Event()
+    chunks = []
+    os.set_blocking(fd, False)
+    loop.add_reader(fd, readable.set)
+    try:
+        while True:
+            await readable.wait()
+            readable.clear()
+            try:
+                chunk = os.read(fd, 1 << 16)
+            except BlockingIOError:
+                continue
+            if not chunk:
+                return b"".join(chunks)
+            chunks.append(chunk)
+    finally:
+        loop.remove_reader(fd)
+        os.close(fd)
+
+
+async def _spawn_capture(argv: List[str]) -> Tuple[int, bytes, bytes]:
+    """Runs a short-lived command, returning (returncode, stdout, stderr).
+
+    Uses posix_spawn, so the parent's address space is never forked and no
+    asyncio subprocess transport is built for a one-off command.
+    """
+    out_r, out_w = os.pipe()
+    err_r, err_w = os.pipe()
+    try:
+        pid = os.posix_spawnp(argv[0], argv, os.environ, file_actions=[
+            (os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0),
+            (os.POSIX_SPAWN_DUP2, out_w, 1),
+            (os.POSIX_SPAWN_DUP2, err_w, 2),
+        ])
+    except BaseException:
+        os.close(out_r)
+        os.close(err_r)
+        raise
+    finally:
+        os.close(out_w)
+        os.close(err_w)
+
+    stdout, stderr = await asyncio.gather(_read_fd(out_r), _read_fd(err_r))
+    # Both pipes are at EOF, so the child has exited or is about to
+    _, status = await asyncio.to_thread(os.waitpid, pid, 0)
+    return os.waitstatus_to_exitcode(status), stdout, stderr
+
+
+@dataclass(slots=True, frozen=True)
+class JobRow:
+    """One job as displayed in the table."""
+
+    job_id: str
+    partition: str
+    name: str
+    state: str
+    time_used: str
+    last_col: str  # NODELIST(REASON)
+
+
 class JobManager:
     """Handles interactions with Slurm commands."""
 
+    # get_job_details results are reused for this many seconds
+    DETAILS_TTL = 2.0
+    DETAILS_MAX_AGE = 60.0
+    DETAILS_CACHE_SIZE = 256
+
+    # Job IDs per scancel call, and how many calls may run at once
+    SCANCEL_BATCH = 64
+    SCANCEL_CONCURRENCY = 4
+
     def __init__(self, user: str):
         self.user = user
-
-    async def get_jobs(self) -> List[Dict[str, Any]]:
-        """Fetches jobs for the current user using squeue --json."""
-        cmd = ["squeue", "-u", self.user, "--json"]
+        # Talk to slurmctld directly through the C bindings when available,
+        # otherwise shell out to the Slurm CLI tools.
+        self._backend = "pyslurm" if pyslurm else "subprocess"
+        self._uid: Optional[int] = None
+        # Job ID -> (time.monotonic() when fetched, details), in LRU order
+        self._details_cache = OrderedDict()
+        # squeue runs in one long-lived shell loop, see _SQUEUE_LOOP
+        self._squeue_helper: Optional[asyncio.subprocess.Process] = None
+        self._squeue_lock = asyncio.Lock()
+
+    async def get_jobs(self) -> AsyncIterator[JobRow]:
+        """Yields the current user's jobs as they are fetched."""
+        if self._backend == "pyslurm":
+            jobs = self._get_jobs_pyslurm()
+        else:
+            jobs = self._get_jobs_subprocess()
+        # Close the backend right away if our caller stops early, so its
+        # cleanup runs (and the squeue lock is released) immediately
+        async with aclosing(jobs):
+            async for job in jobs:
+                yield job
+
+    async def _get_jobs_pyslurm(self) -> AsyncIterator[JobRow]:
+        """Yields jobs for the current user through pyslurm."""
         try:
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+            if self._uid is None:
+                self._uid = pwd.getpwnam(self.user).pw_uid
+            all_jobs = await asyncio.to_thread(lambda: pyslurm.job().get())
+        except Exception as e:
+            logger.error(f"Failed to fetch jobs: {e}")
+            return
+
+        now = int(time.time())
+        for job in all_jobs.values():
+            state = job.get("job_state", "")
+            if job.get("user_id") != self._uid or state not in _ACTIVE_STATES:
+                continue
+
+            # Same NODELIST(REASON) column as squeue's %R: reason if pending, else nodes
+            if state == "PENDING":
+                reason = job.get("state_reason")
+                last_col = f"({reason})" if reason else "(PENDING)"
+            else:
+                last_col = job.get("nodes") or ""
+
+            yield JobRow(
+                str(job.get("job_id", "")),
+                job.get("partition") or "",
+                job.get("name") or "",
+                state,
+                self.format_time_used(job.get("start_time", 0), state, now),
+                last_col,
             )
-            stdout, stderr = await process.communicate()
 
-            if process.returncode != 0:
-                logger.error(f"squeue error: {stderr.decode()}")
-                return []
+    def format_time_used(self, start_time: int, state: str, now: int) -> str:
+        """Formats elapsed run time like squeue's %M."""
+        if state != "RUNNING":
+            return "0:00"
+        
+        diff = now - start_time
+        
+        if diff < 0:
+            return "0:00"
 
-            data = json.loads(stdout.decode())
-            # squeue --json returns a dict with key "jobs" which is a list.
-            jobs = data.get("jobs", [])
-            return jobs
-        except Exception as e:
-            logger.error(f"Failed to fetch jobs: {e}")
-            return []
+        # Common case: under a day, no divmod chain needed
+        if diff < 86400:
+            if diff < 3600:
+                return f"{diff // 60}:{diff % 60:02d}"
+            return f"{diff // 3600}:{(diff // 60) % 60:02d}:{diff % 60:02d}"
+            
+        m, s = divmod(diff, 60)
+        h, m = divmod(m, 60)
+        d, h = divmod(h, 24)
+        return f"{d}-{h:02d}:{m:02d}:{s:02d}"
+
+    async def _get_squeue_helper(self) -> asyncio.subprocess.Process:
+        """Returns the long-lived squeue helper, starting it if needed."""
+        if self._squeue_helper is None or self._squeue_helper.returncode is not None:
+            self._squeue_helper = await asyncio.create_subprocess_exec(
+                "sh", "-c", _SQUEUE_LOOP, "sh", self.user, ",".join(_ACTIVE_STATES), _SQUEUE_FORMAT,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+        return self._squeue_helper
+
+    async def _get_jobs_subprocess(self) -> AsyncIterator[JobRow]:
+        """Yields jobs for the current user using squeue."""
+        async with self._squeue_lock:
+            status = None
+            errors = []
+            malformed = False
+            try:
+                helper = await self._get_squeue_helper()
+                helper.stdin.write(b"\n")
+                await helper.stdin.drain()
+
+                # One job per line, yielded as squeue writes them
+                while line := await helper.stdout.readline():
+                    if line.startswith(_SQUEUE_SENTINEL):
+                        status = int(line[len(_SQUEUE_SENTINEL):])
+                        break
+                    if line.startswith(_SQUEUE_ERROR):
+                        errors.append(line[len(_SQUEUE_ERROR):].decode(errors="replace"))
+                        continue
+                    # Job names may contain "|", so split the fixed fields off both ends
+                    try:
+                        job_id, partition, rest = line.decode().rstrip("\n").split("|", 2)
+                        name, state, time_used, last_col = rest.rsplit("|", 3)
+                    except ValueError:
+                        # Keep reading: squeue's stderr only arrives after its last row
+                        errors.append(f"unexpected output: {line!r}\n")
+                        malformed = True
+                        continue
+                    yield JobRow(job_id, partition, name, state, time_used, last_col)
+                else:
+                    raise EOFError("squeue helper exited")
+            except Exception as e:
+                logger.error(f"Failed to fetch jobs: {e}")
+                if errors:
+                    logger.error(f"squeue error: {''.join(errors).rstrip()}")
+            finally:
+                if status is None:
+                    # A half-read reply would corrupt the next one, start over
+                    await self.close()
+                elif status != 0 or malformed:
+                    logger.error(f"squeue error (status {status}): {''.join(errors).rstrip()}")
+
+    async def close(self) -> None:
+        """Stops the squeue helper, if running, and waits for it to exit."""
+        helper, self._squeue_helper = self._squeue_helper, None
+        if helper and helper.returncode is None:
+            helper.kill()
+            # Reap it while the loop is alive, or its transport is finalized after the loop closes
+            await helper.wait()
 
     async def cancel_jobs(self, job_ids: List[str]) -> bool:
         """Cancels the specified jobs using scancel."""
         if not job_ids:
             return False
-        
+
+        for job_id in job_ids:
+            self._details_cache.pop(job_id, None)
+
+        if len(job_ids) <= self.SCANCEL_BATCH:
+            return await self._scancel(job_ids)
+
+        # Large selections go out as several scancel calls, a few at a time,
+        # keeping command lines short without flooding slurmctld
+        semaphore = asyncio.Semaphore(self.SCANCEL_CONCURRENCY)
+
+        async def run(batch: List[str]) -> bool:
+            async with semaphore:
+                return await self._scancel(batch)
+
+        batches = [job_ids[i:i + self.SCANCEL_BATCH] for i in range(0, len(job_ids), self.SCANCEL_BATCH)]
+        results = await asyncio.gather(*map(run, batches))
+        return all(results)
+
+    async def _scancel(self, job_ids: List[str]) -> bool:
         cmd = ["scancel"] + job_ids
         try:
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, stderr = await process.communicate()
+            returncode, stdout, stderr = await _spawn_capture(cmd)
             
-            if process.returncode != 0:
+            if returncode != 0:
                 logger.error(f"scancel error: {stderr.decode()}")
                 return False
             return True
@@ -82,31 +333,67 @@ class JobManager:
             return False
 
     async def get_job_details(self, job_id: str) -> Dict[str, str]:
+        """Fetches detailed info for a job, reusing results younger than DETAILS_TTL."""
+        cached = self._details_cache.get(job_id)
+        if cached and time.monotonic() - cached[0] < self.DETAILS_TTL:
+            self._details_cache.move_to_end(job_id)
+            return cached[1]
+
+        if self._backend == "pyslurm":
+            details = await self._get_job_details_pyslurm(job_id)
+        else:
+            details = await self._get_job_details_subprocess(job_id)
+
+        if details:
+            self._cache_details(job_id, details)
+        return details
+
+    def _cache_details(self, job_id: str, details: Dict[str, str]) -> None:
+        now = time.monotonic()
+        self._details_cache[job_id] = (now, details)
+        self._details_cache.move_to_end(job_id)
+
+        # Drop stale entries from the LRU end and keep the cache bounded
+        while self._details_cache:
+            oldest_ts, _ = next(iter(self._details_cache.values()))
+            if len(self._details_cache) <= self.DETAILS_CACHE_SIZE and now - oldest_ts < self.DETAILS_MAX_AGE:
+                break
+            self._details_cache.popitem(last=False)
+
+    async def _get_job_details_pyslurm(self, job_id: str) -> Dict[str, str]:
+        """Fetches detailed info for a job through pyslurm."""
+        try:
+            records = await asyncio.to_thread(lambda: pyslurm.job().find_id(job_id))
+            if not records:
+                return {}
+
+            # Rename snake_case fields to the scontrol spelling (std_out -> StdOut)
+            details = {}
+            for key, value in records[0].items():
+                if key == "name":
+                    key = "JobName"
+                else:
+                    key = "".join(part.capitalize() for part in key.split("_"))
+                details[key] = "(null)" if value is None else str(value)
+            return details
+        except Exception as e:
+            logger.error(f"Failed to get job details: {e}")
+            return {}
+
+    async def _get_job_details_subprocess(self, job_id: str) -> Dict[str, str]:
         """Fetches detailed info for a job using scontrol."""
         cmd = ["scontrol", "show", "job", job_id]
         try:
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, stderr = await process.communicate()
+            returncode, stdout, stderr = await _spawn_capture(cmd)
             
-            if process.returncode != 0:
+            if returncode != 0:
                 logger.error(f"scontrol error: {stderr.decode()}")
                 return {}
 
-            # Parse key=value pairs
-            details = {}
-            output = stdout.decode()
-            # Basic parsing - improved regex might be needed for quoted values with spaces
+            # Parse key=value pairs straight from the bytes
+            # Basic parsing - quoted values with spaces are not supported
             # But specific fields like StdOut are usually unquoted paths
-            for line in output.splitlines():
-                parts = line.strip().split()
-                for part in parts:
-                    if "=" in part:
-                        key, value = part.split("=", 1)
-                        details[key] = value
+            details = _parse_kv(stdout)
             return details
         except Exception as e:
             logger.error(f"Failed to get job details: {e}")
@@ -134,6 +421,73 @@ class ConfirmScreen(ModalScreen[bool]):
             self.dismiss(False)
 
 
+class _TailReader:
+    """Follows a growing file like `tail -f`, woken by inotify when available."""
+
+    # How far back from the end to look for the initial lines
+    BACKLOG_BYTES = 1 << 16
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        self._pending = b""
+        self._stop = threading.Event()
+
+        size = os.fstat(self._file.fileno()).st_size
+        start = max(0, size - self.BACKLOG_BYTES)
+        self._file.seek(start)
+        # The first line is probably cut in half, drop it
+        self._skip_partial = start > 0
+
+        self._inotify = None
+        if INotify:
+            try:
+                self._inotify = INotify()
+                self._inotify.add_watch(path, inotify_flags.MODIFY)
+            except BaseException:
+                # e.g. out of inotify watches; don't leak the open file
+                if self._inotify:
+                    self._inotify.close()
+                self._file.close()
+                raise
+
+    @property
+    def stopped(self) -> bool:
+        return self._stop.is_set()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def wait(self, timeout: float) -> None:
+        """Blocks until the file changes, the timeout expires or stop() is called."""
+        if self._inotify:
+            self._inotify.read(timeout=int(timeout * 1000))
+        else:
+            self._stop.wait(timeout)
+
+    def read_lines(self) -> List[str]:
+        """Reads up to EOF and returns the complete lines seen so far."""
+        if os.fstat(self._file.fileno()).st_size < self._file.tell():
+            # Truncated, start over
+            self._file.seek(0)
+            self._pending = b""
+
+        data = self._file.read()
+        if not data:
+            return []
+
+        *lines, self._pending = (self._pending + data).split(b"\n")
+        if self._skip_partial and lines:
+            lines = lines[1:]
+            self._skip_partial = False
+        return [line.decode(errors="replace") for line in lines]
+
+    def close(self) -> None:
+        if self._inotify:
+            self._inotify.close()
+        self._file.close()
+
+
 class LogScreen(ModalScreen):
     """A screen to view logs."""
     
@@ -143,7 +497,8 @@ class LogScreen(ModalScreen):
         super().__init__()
         self.job_id = job_id
         self.log_path = log_path
-        self._tail_process = None
+        self._tail_reader: Optional[_TailReader] = None
+        self._log: Optional[Log] = None  # Set in on_mount
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -152,43 +507,43 @@ class LogScreen(ModalScreen):
         yield Footer()
 
     def on_mount(self) -> None:
-        self.query_one(Log).write(f"Tailing {self.log_path}...\n")
+        self._log = self.query_one(Log)
+        self._log.write(f"Tailing {self.log_path}...\n")
         self.tail_logs()
 
     @work(exclusive=True, thread=True)
     def tail_logs(self) -> None:
+        log = self._log
+        call_from_thread = self.app.call_from_thread
+
         if not os.path.exists(self.log_path):
-            self.app.call_from_thread(self.query_one(Log).write, "Log file not found yet.\n")
+            call_from_thread(log.write, "Log file not found yet.\n")
             return
 
-        # Use tail -f
         try:
-            self._tail_process = subprocess.Popen(
-                ["tail", "-f", "-n", "100", self.log_path],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1
-            )
-            
-            if self._tail_process.stdout is None:
-                 self.app.call_from_thread(self.query_one(Log).write, "Error: Could not capture stdout.\n")
-                 return
-
-            while self._tail_process.poll() is None:
-                line = self._tail_process.stdout.readline()
-                if line:
-                    self.app.call_from_thread(self.query_one(Log).write, line)
-                else:
-                    # Avoid tight loop if no output
-                    import time
-                    time.sleep(0.1)
+            reader = self._tail_reader = _TailReader(self.log_path)
         except Exception as e:
-            self.app.call_from_thread(self.query_one(Log).write, f"Error tailing logs: {e}\n")
+            call_from_thread(log.write, f"Error tailing logs: {e}\n")
+            return
+
+        # Read the file directly and hand whole batches of lines to the
+        # UI thread, waking up only when the file is written to
+        try:
+            worker = get_current_worker()
+            lines = reader.read_lines()[-100:]
+            while not reader.stopped and not worker.is_cancelled:
+                if lines:
+                    call_from_thread(log.write_lines, lines)
+                reader.wait(0.5)
+                lines = reader.read_lines()
+        except Exception as e:
+            call_from_thread(log.write, f"Error tailing logs: {e}\n")
+        finally:
+            reader.close()
 
     async def action_dismiss(self, result: Any = None) -> None:
-        if self._tail_process:
-            self._tail_process.terminate()
+        if self._tail_reader:
+            self._tail_reader.stop()
         self.dismiss()
 
 
@@ -206,12 +561,12 @@ class InspectScreen(ModalScreen):
         yield Header()
         yield Label(f"Details for Job {self.job_id}", classes="inspect_title")
         
-        # Create a clean text representation
-        text = "\n".join([f"{k}: {v}" for k, v in self.details.items()])
-        
-        container = VerticalScroll(classes="inspect_container")
-        with container:
-            yield Static(text)
+        # One line per field; OptionList only renders the lines in view.
+        # Text keeps values like node[01-04] from being read as markup.
+        yield OptionList(
+            *[Text(f"{k}: {v}") for k, v in self.details.items()],
+            classes="inspect_container",
+        )
         
         yield Footer()
 
@@ -279,12 +634,35 @@ class SltopApp(App):
         Binding("r", "refresh_now", "Refresh"),
     ]
 
+    # Refreshes without changes before the interval doubles, and its ceiling
+    IDLE_TICKS = 3
+    MAX_IDLE_REFRESH = 30.0
+
+    COLUMNS = [
+        ("JOBID", "job_id"),
+        ("PARTITION", "partition"),
+        ("NAME", "name"),
+        ("STATE", "state"),
+        ("TIME", "time_used"),
+        ("NODELIST(REASON)", "last_col"),
+    ]
+
     def __init__(self, user: str, refresh_rate: float):
         super().__init__()
         self.user = user
         self.refresh_rate = refresh_rate
         self.job_manager = JobManager(user)
         self.selected_jobs = set()  # Set of job IDs
+        # Job ID -> (displayed JOBID cell, JobRow) for every row in the table
+        self._jobs: Dict[str, Tuple[str, JobRow]] = {}
+        self._styled_id_cache: Dict[str, str] = {}  # Job ID -> JOBID cell, reset on selection change
+        self._refresh_future: Optional[asyncio.Future] = None  # Result of the in-flight refresh
+        self._table: Optional[DataTable] = None  # Set in on_mount
+        self._cursor_row_key: Optional[RowKey] = None  # Row under the cursor, from RowHighlighted
+        self._refresh_timer: Optional[Timer] = None
+        self._refresh_interval = refresh_rate
+        self._jobs_signature: Optional[int] = None  # Hash of (job_id, state, last_col) per job
+        self._idle_ticks = 0  # Refreshes in a row where the signature didn't change
 
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
@@ -293,84 +671,112 @@ class SltopApp(App):
 
     def on_mount(self) -> None:
         self.title = f"Slurm-Top (User: {self.user})"
-        table = self.query_one(DataTable)
-        table.add_columns("JOBID", "PARTITION", "NAME", "STATE", "TIME", "NODELIST(REASON)")
+        table = self._table = self.query_one(DataTable)
+        for label, key in self.COLUMNS:
+            table.add_column(label, key=key)
         
         # Initial load
         self.refresh_jobs()
         # Set interval
-        self.set_interval(self.refresh_rate, self.refresh_jobs)
+        self._refresh_timer = self.set_interval(self.refresh_rate, self._on_refresh_tick)
 
-    def format_time_used(self, start_time: int, state: str) -> str:
-        if state != "RUNNING":
-            return "0:00"
-        
-        now = int(time.time())
-        diff = now - start_time
-        
-        if diff < 0:
-            return "0:00"
-            
-        m, s = divmod(diff, 60)
-        h, m = divmod(m, 60)
-        d, h = divmod(h, 24)
-        
-        if d > 0:
-            return f"{d}-{h:02d}:{m:02d}:{s:02d}"
-        elif h > 0:
-            return f"{h}:{m:02d}:{s:02d}"
-        else:
-            return f"{m}:{s:02d}"
+    async def on_unmount(self) -> None:
+        await self.job_manager.close()
 
-    @work(exclusive=True)
+    def _on_refresh_tick(self) -> None:
+        # A slow squeue shouldn't pile up a waiting worker per tick; the
+        # in-flight refresh will render, and the next tick fetches again
+        if self._refresh_future and not self._refresh_future.done():
+            return
+        self.refresh_jobs()
+
+    @work(group="refresh")
     async def refresh_jobs(self) -> None:
         await self.refresh_jobs_async()
 
-    async def refresh_jobs_async(self) -> None:
-        jobs = await self.job_manager.get_jobs()
-        
-        table = self.query_one(DataTable)
-        
-        # Store current cursor/selection state if needed, but for now simple clear/add
-        # To make it smoother, we could update rows, but clear() is easier for MVP
-        
-        # Preserve selection
-        current_row_key = None
-        try:
+    async def refresh_jobs_async(self, force: bool = False) -> None:
+        """Refreshes the table; with force, never reuses a query started before this call."""
+        table = self._table
+
+        if force and self._refresh_future and not self._refresh_future.done():
+            # That query may predate the caller's change (e.g. a scancel),
+            # let it finish and then fetch again
+            await asyncio.wait([self._refresh_future])
+
+        # Reconcile the table against the fresh job list: only touch cells
+        # that changed, so the cursor and unchanged rows are left alone
+        seen = set()
+
+        # Single-flight: if a refresh is already talking to Slurm, render
+        # its result instead of starting another query
+        if self._refresh_future and not self._refresh_future.done():
+            jobs = await self._refresh_future
+            if self._refresh_future is not None:
+                # A newer refresh started while we waited and is already
+                # adding fresher rows; rendering (and pruning) ours would undo it
+                return
+            for job in jobs:
+                self._update_row(table, job, seen)
+        else:
+            future = self._refresh_future = asyncio.get_running_loop().create_future()
+            try:
+                jobs = []
+                async for job in self.job_manager.get_jobs():
+                    jobs.append(job)
+                    self._update_row(table, job, seen)
+                future.set_result(jobs)
+                self._track_activity(jobs)
+            finally:
+                if not future.done():
+                    future.cancel()
+                self._refresh_future = None
+
+        removed = self._jobs.keys() - seen
+        for job_id in removed:
+            table.remove_row(job_id)
+            del self._jobs[job_id]
+            self._styled_id_cache.pop(job_id, None)
+
+        # Removing rows shifts the ones below up under the cursor without a
+        # RowHighlighted event, so look the highlighted row up again
+        if removed:
+            self._cursor_row_key = None
             if table.row_count > 0:
-                current_row_key = table.coordinate_to_cell_key(table.cursor_coordinate).row_key
-        except:
-            pass
+                self._cursor_row_key = table.coordinate_to_cell_key(table.cursor_coordinate).row_key
 
-        table.clear()
+    def _track_activity(self, jobs: List[JobRow]) -> None:
+        """Backs the refresh interval off while the job list isn't changing."""
+        signature = hash(frozenset((job.job_id, job.state, job.last_col) for job in jobs))
+        if signature == self._jobs_signature:
+            self._idle_ticks += 1
+        else:
+            self._jobs_signature = signature
+            self._idle_ticks = 0
+
+        # Double the interval every IDLE_TICKS unchanged refreshes
+        backoff = 2 ** min(self._idle_ticks // self.IDLE_TICKS, 8)
+        self._set_refresh_interval(min(self.refresh_rate * backoff, max(self.MAX_IDLE_REFRESH, self.refresh_rate)))
+
+    def _set_refresh_interval(self, interval: float) -> None:
+        if interval == self._refresh_interval:
+            return
+        self._refresh_interval = interval
+        if self._refresh_timer:
+            self._refresh_timer.stop()
+            self._refresh_timer = self.set_interval(interval, self._on_refresh_tick)
+
+    def _reset_refresh_interval(self) -> None:
+        """Goes back to the configured refresh rate, e.g. after user input."""
+        self._idle_ticks = 0
+        self._set_refresh_interval(self.refresh_rate)
+
+    def _update_row(self, table: DataTable, job: JobRow, seen: set) -> None:
+        """Adds or updates the table row for a job, recording its ID in seen."""
+        job_id = job.job_id
         
-        for job in jobs:
-            # Map JSON keys to columns
-            # Keys from squeue --json: "job_id", "partition", "name", "job_state", "time_used", "nodes" (or "reason" if pending)
-            
-            job_id = str(job.get("job_id", ""))
-            partition = job.get("partition", "")
-            name = job.get("name", "")
-            state = job.get("job_state", "")
-            start_time = job.get("start_time", 0)
-            time_used = self.format_time_used(start_time, state)
-            
-            # Filter out cancelled/completed jobs if desired
-            if state in ["CANCELLED", "COMPLETED", "FAILED", "TIMEOUT"]:
-                continue
-            
-            # Logic for NodeList vs Reason
-            nodes = job.get("nodes", "")
-            reason = job.get("job_reason", "") # specific reason field if present
-            
-            # If state is PENDING, show reason, else nodes
-            if state == "PENDING":
-                last_col = f"({reason})" if reason else "(PENDING)"
-            else:
-                last_col = nodes
-            
-            # Styling row if selected
-            label = None
+        # Styling row if selected
+        job_id_display = self._styled_id_cache.get(job_id)
+        if job_id_display is None:
             if job_id in self.selected_jobs:
                 # Textual DataTable doesn't support row styling easily via simple add_row
                 # We can use styled text
@@ -378,51 +784,53 @@ class SltopApp(App):
                 job_id_display = f"[bold green]* {job_id}[/]"
             else:
                 job_id_display = job_id
-
-            table.add_row(
-                job_id_display, 
-                partition, 
-                name, 
-                state, 
-                time_used, 
-                last_col, 
-                key=job_id
-            )
-
-        # Restore cursor if possible
-        if current_row_key:
-            try:
-                row_index = table.get_row_index(current_row_key)
-                table.move_cursor(row=row_index)
-            except Exception:
-                pass
+            self._styled_id_cache[job_id] = job_id_display
+
+        seen.add(job_id)
+
+        shown = self._jobs.get(job_id)
+        if shown is None:
+            table.add_row(job_id_display, job.partition, job.name, job.state, job.time_used, job.last_col, key=job_id)
+        elif shown != (job_id_display, job):
+            shown_id_display, shown_job = shown
+            if job_id_display != shown_id_display:
+                table.update_cell(job_id, "job_id", job_id_display)
+            # Column keys after JOBID are JobRow field names
+            for _, field in self.COLUMNS[1:]:
+                value = getattr(job, field)
+                if value != getattr(shown_job, field):
+                    table.update_cell(job_id, field, value)
+        self._jobs[job_id] = (job_id_display, job)
+
+    def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
+        # Events queued by remove_row can arrive after the row is gone
+        if event.row_key.value in self._jobs:
+            self._cursor_row_key = event.row_key
 
     def action_toggle_select(self) -> None:
-        table = self.query_one(DataTable)
-        try:
-            row_key = table.coordinate_to_cell_key(table.cursor_coordinate).row_key
-            job_id = row_key.value
-            
-            if job_id in self.selected_jobs:
-                self.selected_jobs.remove(job_id)
-            else:
-                self.selected_jobs.add(job_id)
-            
-            self.refresh_jobs()
-        except Exception:
-            pass
+        self._reset_refresh_interval()
+        job_id = getattr(self._cursor_row_key, "value", None)
+        if job_id not in self._jobs:
+            return
+        
+        if job_id in self.selected_jobs:
+            self.selected_jobs.remove(job_id)
+        else:
+            self.selected_jobs.add(job_id)
+        self._styled_id_cache.pop(job_id, None)
+        
+        self.refresh_jobs()
 
     def action_kill_job(self) -> None:
-        table = self.query_one(DataTable)
+        self._reset_refresh_interval()
         targets = list(self.selected_jobs)
         
         if not targets:
             # If no selection, target the highlighted row
-            try:
-                row_key = table.coordinate_to_cell_key(table.cursor_coordinate).row_key
-                targets = [row_key.value]
-            except:
+            job_id = getattr(self._cursor_row_key, "value", None)
+            if job_id not in self._jobs:
                 return
+            targets = [job_id]
 
         if not targets:
             return
@@ -442,17 +850,16 @@ class SltopApp(App):
         if success:
             self.notify(f"Cancelled {len(job_ids)} jobs.")
             self.selected_jobs.clear() # Clear selection after action
-            await self.refresh_jobs_async()
+            self._styled_id_cache.clear()
+            await self.refresh_jobs_async(force=True)
         else:
             self.notify("Failed to cancel some jobs.", severity="error")
 
     @work
     async def action_view_logs(self) -> None:
-        table = self.query_one(DataTable)
-        try:
-            row_key = table.coordinate_to_cell_key(table.cursor_coordinate).row_key
-            job_id = row_key.value
-        except:
+        self._reset_refresh_interval()
+        job_id = getattr(self._cursor_row_key, "value", None)
+        if job_id not in self._jobs:
             return
 
         details = await self.job_manager.get_job_details(job_id)
@@ -471,17 +878,16 @@ class SltopApp(App):
 
     @work
     async def action_inspect_job(self) -> None:
-        table = self.query_one(DataTable)
-        try:
-            row_key = table.coordinate_to_cell_key(table.cursor_coordinate).row_key
-            job_id = row_key.value
-        except:
+        self._reset_refresh_interval()
+        job_id = getattr(self._cursor_row_key, "value", None)
+        if job_id not in self._jobs:
             return
 
         details = await self.job_manager.get_job_details(job_id)
         self.app.push_screen(InspectScreen(job_id, details))
 
     def action_refresh_now(self) -> None:
+        self._reset_refresh_interval()
         self.refresh_jobs()
 
 